@@ -2,17 +2,52 @@
 
 Provides app instances with various ADMIN_API_KEY configurations
 and isolated data directories for filesystem-backed persistence.
+
+Per-test clients are never entered as context managers, so the app's
+lifespan (data dir setup, soul template load, startup logging) does not run
+for them.  ``shared_client`` enters it once per session; ``test_startup.py``
+exercises the lifespan directly.
 """
 
 from __future__ import annotations
 
+import os
+
 import pytest
 from fastapi.testclient import TestClient
+from hypothesis import settings
+from hypothesis.database import DirectoryBasedExampleDatabase
 
 import app as app_module
 import memory as memory_module
 
 
+# Every property test does a full HTTP round-trip per example, so the default
+# budget is 50 examples.  Select another profile with HYPOTHESIS_PROFILE,
+# e.g. "fast" for quick local loops or "thorough" for nightly runs.  Profiles
+# build on Hypothesis' "default" explicitly; otherwise they would inherit
+# whichever profile Hypothesis loaded at import (its derandomized "ci" one
+# when CI is set).
+_base = settings.get_profile("default")
+settings.register_profile("dev", parent=_base, max_examples=50)
+settings.register_profile("fast", parent=_base, max_examples=30)
+settings.register_profile("thorough", parent=_base, max_examples=500)
+# Persist Hypothesis examples on CI so the cached .hypothesis/ directory lets
+# later runs replay known inputs instead of re-exploring from scratch.
+settings.register_profile(
+    "ci",
+    parent=settings.get_profile("dev"),
+    database=DirectoryBasedExampleDatabase(".hypothesis/examples"),
+    # Hypothesis' built-in "ci" profile is derandomized, which would make the
+    # database pointless: every run would replay the same inputs.
+    derandomize=False,
+    print_blob=True,
+)
+settings.load_profile(
+    os.getenv("HYPOTHESIS_PROFILE", "ci" if os.getenv("CI") == "true" else "dev")
+)
+
+
 @pytest.fixture()
 def tmp_data_dir(tmp_path, monkeypatch):
     """Redirect DATA_DIR to a temporary directory so tests don't pollute the real filesystem."""
@@ -25,26 +60,35 @@ def configured_app(tmp_data_dir, monkeypatch):  # noqa: ARG001
     """Return a TestClient whose app has ADMIN_API_KEY set to a known value.
 
     The key is ``"test-secret-key"`` — tests that need a specific key should
-    use the ``configured_client_factory`` fixture instead.
+    use ``shared_client`` and patch ``app.ADMIN_API_KEY`` themselves.
     """
     monkeypatch.setattr(app_module, "ADMIN_API_KEY", "test-secret-key")
     return TestClient(app_module.app, raise_server_exceptions=False)
 
 
-@pytest.fixture()
-def unconfigured_app(tmp_data_dir, monkeypatch):  # noqa: ARG001
-    """Return a TestClient whose app has ADMIN_API_KEY empty (unconfigured)."""
-    monkeypatch.setattr(app_module, "ADMIN_API_KEY", "")
-    return TestClient(app_module.app, raise_server_exceptions=False)
+@pytest.fixture(scope="session")
+def session_data_dir(tmp_path_factory):
+    """Return one scratch directory for tests that share DATA_DIR across a session.
 
+    Old base temp dirs are rotated by pytest on later runs, so nothing is
+    torn down on the hot path.
+    """
+    return tmp_path_factory.mktemp("data")
 
-@pytest.fixture()
-def configured_client_factory(tmp_data_dir, monkeypatch):  # noqa: ARG001
-    """Factory fixture: returns a (client, key) tuple for a given ADMIN_API_KEY value."""
 
-    def _make(api_key: str):
-        monkeypatch.setattr(app_module, "ADMIN_API_KEY", api_key)
-        client = TestClient(app_module.app, raise_server_exceptions=False)
-        return client, api_key
+@pytest.fixture(scope="session")
+def shared_client(session_data_dir):
+    """Return one TestClient reused by every test in the session.
 
-    return _make
+    Property tests vary ``ADMIN_API_KEY`` per Hypothesis example; the app's
+    route table and the client's transport don't change, so there is no need
+    to rebuild the client for each example.  The client is entered once so
+    all requests share a single event-loop portal instead of starting one per
+    request; that runs the lifespan once.  DATA_DIR stays on
+    ``session_data_dir`` while the client is open, so tests using it share
+    that scratch directory.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(memory_module, "DATA_DIR", session_data_dir)
+        with TestClient(app_module.app, raise_server_exceptions=False) as client:
+            yield client
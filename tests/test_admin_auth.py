@@ -9,10 +9,10 @@ to verify the authentication dependency behaves correctly across all inputs.
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+import functools
 
 import hypothesis.strategies as st
+import pytest
 from hypothesis import given, settings, HealthCheck
 from fastapi.testclient import TestClient
 
@@ -22,34 +22,38 @@ import memory as memory_module
 
 # ── Strategies ──────────────────────────────────────────────────────────────
 
-# Non-empty strings suitable for use as API keys (printable ASCII, no whitespace).
-api_key_strategy = st.text(
-    alphabet=st.characters(
-        whitelist_categories=("L", "N", "P", "S"),
-        min_codepoint=33,
-        max_codepoint=126,
-    ),
-    min_size=1,
-    max_size=64,
+# Printable ASCII without whitespace.
+_visible_ascii = st.characters(
+    whitelist_categories=("L", "N", "P", "S"),
+    min_codepoint=33,
+    max_codepoint=126,
 )
 
-# Non-empty fact strings for /api/memory/{phone_hash}
-fact_strategy = st.text(min_size=1, max_size=200).filter(lambda s: s.strip())
+# Non-empty strings suitable for use as API keys.
+api_key_strategy = st.text(alphabet=_visible_ascii, min_size=1, max_size=64)
+
+# Non-empty fact strings for /api/memory/{phone_hash}.  The alphabet has no
+# whitespace, so every draw is non-blank without a rejecting .filter().
+fact_strategy = st.text(alphabet=_visible_ascii, min_size=1, max_size=200)
 
 # Non-empty note strings for /api/notes
-note_strategy = st.text(min_size=1, max_size=200).filter(lambda s: s.strip())
+note_strategy = st.text(alphabet=_visible_ascii, min_size=1, max_size=200)
 
-# Phone hash path parameter — hex-like strings
-phone_hash_strategy = st.text(
-    alphabet="0123456789abcdef",
-    min_size=8,
-    max_size=64,
-)
+# Phone hash path parameter.  Its value doesn't affect auth, so a few fixed
+# hex strings are enough.
+phone_hash_strategy = st.sampled_from(["abc12345", "deadbeef", "f00dface", "cafed00d"])
 
 # Strategy that picks which admin endpoint to hit
 endpoint_strategy = st.sampled_from(["memory", "notes"])
 
 
+# Admin endpoint dispatch: endpoint name -> (path template, body builder).
+_ADMIN_ENDPOINTS = {
+    "memory": ("/api/memory/{phone_hash}", lambda fact, note: {"fact": fact}),
+    "notes": ("/api/notes", lambda fact, note: {"note": note}),
+}
+
+
 def _post_admin(
     client: TestClient,
     endpoint: str,
@@ -59,18 +63,22 @@ def _post_admin(
     headers: dict,
 ):
     """Helper to POST to the chosen admin endpoint with the given headers."""
-    if endpoint == "memory":
-        return client.post(
-            f"/api/memory/{phone_hash}",
-            json={"fact": fact},
-            headers=headers,
-        )
-    else:
-        return client.post(
-            "/api/notes",
-            json={"note": note},
-            headers=headers,
-        )
+    path, body = _ADMIN_ENDPOINTS[endpoint]
+    return client.post(
+        path.format(phone_hash=phone_hash),
+        json=body(fact, note),
+        headers=headers,
+    )
+
+
+def _clear_data_dir() -> None:
+    """Remove persisted stores so each example starts from an empty DATA_DIR.
+
+    ``shared_client`` keeps DATA_DIR on one session scratch directory; reusing
+    it is cheaper than a fresh directory per Hypothesis example.
+    """
+    for path in memory_module.DATA_DIR.iterdir():
+        path.unlink()
 
 
 # ── Property 1: Valid admin auth grants access ─────────────────────────────
@@ -84,59 +92,66 @@ def _post_admin(
     phone_hash=phone_hash_strategy,
     endpoint=endpoint_strategy,
 )
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_valid_admin_auth_grants_access(
-    api_key, fact, note, phone_hash, endpoint, monkeypatch
+    api_key, fact, note, phone_hash, endpoint, shared_client, monkeypatch
 ):
     """P1: For any configured ADMIN_API_KEY and valid request body,
     Bearer token matching the key returns 2xx."""
-    with tempfile.TemporaryDirectory() as tmp:
-        monkeypatch.setattr(memory_module, "DATA_DIR", Path(tmp))
-        monkeypatch.setattr(app_module, "ADMIN_API_KEY", api_key)
+    _clear_data_dir()
+    monkeypatch.setattr(app_module, "ADMIN_API_KEY", api_key)
 
-        client = TestClient(app_module.app, raise_server_exceptions=False)
-        headers = {"Authorization": f"Bearer {api_key}"}
+    headers = {"Authorization": f"Bearer {api_key}"}
 
-        resp = _post_admin(client, endpoint, phone_hash, fact, note, headers)
-        assert 200 <= resp.status_code < 300, (
-            f"Expected 2xx for valid auth, got {resp.status_code}: {resp.text}"
-        )
+    resp = _post_admin(shared_client, endpoint, phone_hash, fact, note, headers)
+    assert 200 <= resp.status_code < 300, (
+        f"Expected 2xx for valid auth, got {resp.status_code}: {resp.text}"
+    )
 
 
 # ── Property 2: Invalid admin auth is rejected ─────────────────────────────
 # **Validates: Requirements 2.2, 2.4**
 
 
+# Malformed Authorization values.  Arbitrary text all takes the same rejection
+# path, so a fixed corpus covers it without generating and shrinking junk.
+# None of these can match a key from api_key_strategy (no whitespace).
+_GARBAGE_HEADERS = [
+    "A",
+    "x" * 100,
+    "Bearer\t",
+    "Bearer\x7f",
+    "!@#$%",
+    "Bearer  ",
+    "bEArEr not the key",
+    "Bear er k",
+    ";;;;",
+    "\\0",
+]
+_garbage_header = st.sampled_from(_GARBAGE_HEADERS).map(lambda t: {"Authorization": t})
+
+# Invalid-header strategies that don't depend on the configured key.
+_BASE_INVALID_STRATEGIES = (
+    api_key_strategy.map(lambda t: {"Authorization": f"Basic {t}"}),  # wrong scheme
+    st.just({}),  # missing header
+    st.just({"Authorization": "Bearer "}),  # empty bearer
+    st.just({"Authorization": "Bearer"}),  # bearer, no space
+    _garbage_header,  # malformed header
+)
+
+
+@functools.lru_cache(maxsize=64)
 def _invalid_auth_header(admin_key: str):
     """Strategy that generates auth header values that do NOT match the configured key."""
-    # HTTP headers must be ASCII-encodable, so constrain all generated values accordingly.
-    ascii_printable = st.text(
-        alphabet=st.characters(min_codepoint=32, max_codepoint=126),
-        min_size=1,
-        max_size=100,
-    )
     wrong_token = api_key_strategy.filter(lambda t: t != admin_key).map(
         lambda t: {"Authorization": f"Bearer {t}"}
     )
-    wrong_scheme = api_key_strategy.map(
-        lambda t: {"Authorization": f"Basic {t}"}
-    )
-    missing_header = st.just({})
-    empty_bearer = st.just({"Authorization": "Bearer "})
-    bearer_no_space = st.just({"Authorization": "Bearer"})
-    random_garbage = ascii_printable.map(
-        lambda t: {"Authorization": t}
-    )
-
-    return st.one_of(
-        wrong_token, wrong_scheme, missing_header,
-        empty_bearer, bearer_no_space, random_garbage,
-    )
+    return st.one_of(wrong_token, *_BASE_INVALID_STRATEGIES)
 
 
 @given(data=st.data())
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_invalid_admin_auth_is_rejected(data, monkeypatch):
+@settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+def test_invalid_admin_auth_is_rejected(data, shared_client, monkeypatch):
     """P2: For any configured ADMIN_API_KEY and any non-matching auth header,
     response is 401."""
     api_key = data.draw(api_key_strategy, label="admin_key")
@@ -146,16 +161,13 @@ def test_invalid_admin_auth_is_rejected(data, monkeypatch):
     endpoint = data.draw(endpoint_strategy, label="endpoint")
     headers = data.draw(_invalid_auth_header(api_key), label="invalid_headers")
 
-    with tempfile.TemporaryDirectory() as tmp:
-        monkeypatch.setattr(memory_module, "DATA_DIR", Path(tmp))
-        monkeypatch.setattr(app_module, "ADMIN_API_KEY", api_key)
-
-        client = TestClient(app_module.app, raise_server_exceptions=False)
+    _clear_data_dir()
+    monkeypatch.setattr(app_module, "ADMIN_API_KEY", api_key)
 
-        resp = _post_admin(client, endpoint, phone_hash, fact, note, headers)
-        assert resp.status_code == 401, (
-            f"Expected 401 for invalid auth, got {resp.status_code}: {resp.text}"
-        )
+    resp = _post_admin(shared_client, endpoint, phone_hash, fact, note, headers)
+    assert resp.status_code == 401, (
+        f"Expected 401 for invalid auth, got {resp.status_code}: {resp.text}"
+    )
 
 
 # ── Property 3: Unconfigured admin key disables admin endpoints ─────────────
@@ -170,28 +182,21 @@ def test_invalid_admin_auth_is_rejected(data, monkeypatch):
     auth_header=st.one_of(
         st.just({}),
         api_key_strategy.map(lambda k: {"Authorization": f"Bearer {k}"}),
-        st.text(
-            alphabet=st.characters(min_codepoint=32, max_codepoint=126),
-            min_size=1,
-            max_size=100,
-        ).map(lambda t: {"Authorization": t}),
+        _garbage_header,
     ),
 )
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_unconfigured_admin_key_disables_endpoints(
-    fact, note, phone_hash, endpoint, auth_header, monkeypatch
+    fact, note, phone_hash, endpoint, auth_header, shared_client, monkeypatch
 ):
     """P3: For any request when ADMIN_API_KEY is empty, response is 403."""
-    with tempfile.TemporaryDirectory() as tmp:
-        monkeypatch.setattr(memory_module, "DATA_DIR", Path(tmp))
-        monkeypatch.setattr(app_module, "ADMIN_API_KEY", "")
+    _clear_data_dir()
+    monkeypatch.setattr(app_module, "ADMIN_API_KEY", "")
 
-        client = TestClient(app_module.app, raise_server_exceptions=False)
-
-        resp = _post_admin(client, endpoint, phone_hash, fact, note, auth_header)
-        assert resp.status_code == 403, (
-            f"Expected 403 for unconfigured key, got {resp.status_code}: {resp.text}"
-        )
+    resp = _post_admin(shared_client, endpoint, phone_hash, fact, note, auth_header)
+    assert resp.status_code == 403, (
+        f"Expected 403 for unconfigured key, got {resp.status_code}: {resp.text}"
+    )
 
 
 # ── Unit Tests: Admin Auth Edge Cases ───────────────────────────────────────
@@ -199,81 +204,49 @@ def test_unconfigured_admin_key_disables_endpoints(
 
 
 class TestAdminEndpointsIndependently:
-    """Test both admin endpoints independently for auth behavior."""
-
-    # -- /api/memory/{phone_hash} --
-
-    def test_memory_endpoint_accepts_valid_bearer(self, configured_app):
-        """Validates: Requirement 2.1, 2.4 — valid auth on /api/memory/{phone_hash}."""
-        resp = configured_app.post(
-            "/api/memory/abc123",
-            json={"fact": "likes cats"},
-            headers={"Authorization": "Bearer test-secret-key"},
-        )
-        assert resp.status_code == 200
-
-    def test_memory_endpoint_rejects_missing_auth(self, configured_app):
-        """Validates: Requirement 2.2, 2.4 — missing auth on /api/memory/{phone_hash}."""
-        resp = configured_app.post(
-            "/api/memory/abc123",
-            json={"fact": "likes cats"},
-        )
-        assert resp.status_code == 401
-
-    def test_memory_endpoint_rejects_wrong_key(self, configured_app):
-        """Validates: Requirement 2.2, 2.4 — wrong key on /api/memory/{phone_hash}."""
-        resp = configured_app.post(
-            "/api/memory/abc123",
-            json={"fact": "likes cats"},
-            headers={"Authorization": "Bearer wrong-key"},
-        )
-        assert resp.status_code == 401
-
-    def test_memory_endpoint_returns_403_when_unconfigured(self, unconfigured_app):
-        """Validates: Requirement 2.3 — unconfigured key on /api/memory/{phone_hash}."""
-        resp = unconfigured_app.post(
-            "/api/memory/abc123",
-            json={"fact": "likes cats"},
-            headers={"Authorization": "Bearer any-key"},
-        )
-        assert resp.status_code == 403
-
-    # -- /api/notes --
-
-    def test_notes_endpoint_accepts_valid_bearer(self, configured_app):
-        """Validates: Requirement 2.1, 2.4 — valid auth on /api/notes."""
-        resp = configured_app.post(
-            "/api/notes",
-            json={"note": "test note"},
-            headers={"Authorization": "Bearer test-secret-key"},
-        )
-        assert resp.status_code == 200
-
-    def test_notes_endpoint_rejects_missing_auth(self, configured_app):
-        """Validates: Requirement 2.2, 2.4 — missing auth on /api/notes."""
-        resp = configured_app.post(
-            "/api/notes",
-            json={"note": "test note"},
-        )
-        assert resp.status_code == 401
-
-    def test_notes_endpoint_rejects_wrong_key(self, configured_app):
-        """Validates: Requirement 2.2, 2.4 — wrong key on /api/notes."""
-        resp = configured_app.post(
-            "/api/notes",
-            json={"note": "test note"},
-            headers={"Authorization": "Bearer wrong-key"},
-        )
-        assert resp.status_code == 401
-
-    def test_notes_endpoint_returns_403_when_unconfigured(self, unconfigured_app):
-        """Validates: Requirement 2.3 — unconfigured key on /api/notes."""
-        resp = unconfigured_app.post(
-            "/api/notes",
-            json={"note": "test note"},
-            headers={"Authorization": "Bearer any-key"},
+    """Test both admin endpoints independently for auth behavior.
+
+    Validates: Requirements 2.1, 2.2, 2.3, 2.4.
+    """
+
+    @pytest.mark.parametrize("endpoint", ["memory", "notes"])
+    @pytest.mark.parametrize(
+        "admin_key,headers,expected_status",
+        [
+            # Validates: Requirement 2.1, 2.4 — valid auth.
+            pytest.param(
+                "test-secret-key",
+                {"Authorization": "Bearer test-secret-key"},
+                200,
+                id="accepts-valid-bearer",
+            ),
+            # Validates: Requirement 2.2, 2.4 — missing auth.
+            pytest.param("test-secret-key", {}, 401, id="rejects-missing-auth"),
+            # Validates: Requirement 2.2, 2.4 — wrong key.
+            pytest.param(
+                "test-secret-key",
+                {"Authorization": "Bearer wrong-key"},
+                401,
+                id="rejects-wrong-key",
+            ),
+            # Validates: Requirement 2.3 — unconfigured key.
+            pytest.param(
+                "",
+                {"Authorization": "Bearer any-key"},
+                403,
+                id="403-when-unconfigured",
+            ),
+        ],
+    )
+    def test_endpoint_auth(
+        self, shared_client, monkeypatch, endpoint, admin_key, headers, expected_status
+    ):
+        """Each admin endpoint returns the expected status for the given key and headers."""
+        monkeypatch.setattr(app_module, "ADMIN_API_KEY", admin_key)
+        resp = _post_admin(
+            shared_client, endpoint, "abc123", "likes cats", "test note", headers
         )
-        assert resp.status_code == 403
+        assert resp.status_code == expected_status
 
 
 class TestPublicEndpointsNoAuth:
@@ -307,89 +280,35 @@ class TestPublicEndpointsNoAuth:
 class TestAuthEdgeCases:
     """Edge cases for the auth dependency: empty keys, whitespace, partial match, wrong scheme."""
 
-    def test_empty_string_key_rejected(self, configured_app):
-        """Empty string Bearer token should be rejected as 401."""
-        resp = configured_app.post(
-            "/api/memory/abc123",
-            json={"fact": "test"},
-            headers={"Authorization": "Bearer "},
-        )
-        assert resp.status_code == 401
-
-    def test_whitespace_only_key_rejected(self, configured_client_factory):
-        """A whitespace-only ADMIN_API_KEY should behave as unconfigured (403)."""
-        # Whitespace-only string is falsy after strip, but the code uses
-        # `if not ADMIN_API_KEY` which checks truthiness of the raw string.
-        # "   " is truthy, so it's treated as configured — auth should work
-        # against that whitespace key. Sending a non-matching token → 401.
-        client, _ = configured_client_factory("   ")
-        resp = client.post(
-            "/api/notes",
-            json={"note": "test"},
-            headers={"Authorization": "Bearer wrong"},
-        )
-        assert resp.status_code == 401
-
-    def test_whitespace_key_exact_match_accepted(self, configured_client_factory):
-        """If ADMIN_API_KEY is whitespace, sending that exact whitespace should succeed."""
-        client, _ = configured_client_factory("   ")  # noqa: RUF -- key unused intentionally
-        resp = client.post(
-            "/api/notes",
-            json={"note": "test"},
-            headers={"Authorization": "Bearer    "},
-        )
-        assert resp.status_code == 200
-
-    def test_partial_key_match_rejected(self, configured_app):
-        """A prefix of the real key should be rejected."""
-        resp = configured_app.post(
-            "/api/memory/abc123",
-            json={"fact": "test"},
-            headers={"Authorization": "Bearer test-secret"},
-        )
-        assert resp.status_code == 401
-
-    def test_key_suffix_rejected(self, configured_app):
-        """A suffix of the real key should be rejected."""
-        resp = configured_app.post(
-            "/api/memory/abc123",
-            json={"fact": "test"},
-            headers={"Authorization": "Bearer secret-key"},
-        )
-        assert resp.status_code == 401
-
-    def test_basic_scheme_rejected(self, configured_app):
-        """Using Basic scheme instead of Bearer should be rejected."""
-        resp = configured_app.post(
-            "/api/notes",
-            json={"note": "test"},
-            headers={"Authorization": "Basic test-secret-key"},
-        )
-        assert resp.status_code == 401
-
-    def test_no_scheme_just_token_rejected(self, configured_app):
-        """Sending just the token without a scheme should be rejected."""
-        resp = configured_app.post(
-            "/api/memory/abc123",
-            json={"fact": "test"},
-            headers={"Authorization": "test-secret-key"},
-        )
-        assert resp.status_code == 401
-
-    def test_bearer_lowercase_accepted(self, configured_app):
-        """The scheme check should be case-insensitive per the design (scheme.lower())."""
-        resp = configured_app.post(
-            "/api/notes",
-            json={"note": "test"},
-            headers={"Authorization": "bearer test-secret-key"},
-        )
-        assert resp.status_code == 200
-
-    def test_bearer_uppercase_accepted(self, configured_app):
-        """BEARER scheme should also be accepted (case-insensitive)."""
-        resp = configured_app.post(
-            "/api/memory/abc123",
-            json={"fact": "test"},
-            headers={"Authorization": "BEARER test-secret-key"},
+    # A whitespace-only ADMIN_API_KEY is truthy (the code uses
+    # `if not ADMIN_API_KEY`), so it's treated as configured — auth works
+    # against that whitespace key, and a non-matching token gets 401.
+    @pytest.mark.parametrize(
+        "admin_key,endpoint,auth_header,expected_status",
+        [
+            pytest.param("test-secret-key", "memory", "Bearer ", 401, id="empty-token"),
+            pytest.param("   ", "notes", "Bearer wrong", 401, id="whitespace-key-wrong-token"),
+            pytest.param("   ", "notes", "Bearer    ", 200, id="whitespace-key-exact-match"),
+            pytest.param("test-secret-key", "memory", "Bearer test-secret", 401, id="key-prefix"),
+            pytest.param("test-secret-key", "memory", "Bearer secret-key", 401, id="key-suffix"),
+            pytest.param("test-secret-key", "notes", "Basic test-secret-key", 401, id="basic-scheme"),
+            pytest.param("test-secret-key", "memory", "test-secret-key", 401, id="no-scheme"),
+            # The scheme check is case-insensitive per the design (scheme.lower()).
+            pytest.param("test-secret-key", "notes", "bearer test-secret-key", 200, id="lowercase-scheme"),
+            pytest.param("test-secret-key", "memory", "BEARER test-secret-key", 200, id="uppercase-scheme"),
+        ],
+    )
+    def test_auth_edge_case(
+        self, shared_client, monkeypatch, admin_key, endpoint, auth_header, expected_status
+    ):
+        """Validates: Requirement 2.4 — the auth header edge case yields the expected status."""
+        monkeypatch.setattr(app_module, "ADMIN_API_KEY", admin_key)
+        resp = _post_admin(
+            shared_client,
+            endpoint,
+            "abc123",
+            "test",
+            "test",
+            {"Authorization": auth_header},
         )
-        assert resp.status_code == 200
+        assert resp.status_code == expected_status
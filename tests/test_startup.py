@@ -24,11 +24,9 @@ def tmp_data_dir(tmp_path, monkeypatch):
 
 
 async def _run_lifespan_startup():
-    """Enter the lifespan context manager (startup phase only)."""
-    ctx = app_module.lifespan(app_module.app)
-    await ctx.__aenter__()
-    # Run shutdown as well to be clean
-    await ctx.__aexit__(None, None, None)
+    """Run the lifespan context manager (startup, then shutdown to be clean)."""
+    async with app_module.lifespan(app_module.app):
+        pass
 
 
 def test_warning_when_webhook_secret_not_set(tmp_data_dir, monkeypatch, caplog):  # noqa: ARG001
@@ -36,7 +34,7 @@ def test_warning_when_webhook_secret_not_set(tmp_data_dir, monkeypatch, caplog):
     monkeypatch.setattr(app_module, "WEBHOOK_SECRET", "")
 
     with caplog.at_level(logging.DEBUG, logger="app"):
-        asyncio.get_event_loop().run_until_complete(_run_lifespan_startup())
+        asyncio.run(_run_lifespan_startup())
 
     assert any(
         "WEBHOOK_SECRET is not configured" in rec.message
@@ -50,7 +48,7 @@ def test_info_when_webhook_secret_is_set(tmp_data_dir, monkeypatch, caplog):  #
     monkeypatch.setattr(app_module, "WEBHOOK_SECRET", "some-secret-value")
 
     with caplog.at_level(logging.DEBUG, logger="app"):
-        asyncio.get_event_loop().run_until_complete(_run_lifespan_startup())
+        asyncio.run(_run_lifespan_startup())
 
     assert any(
         "Webhook signature verification is enabled" in rec.message